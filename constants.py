@@ -0,0 +1,11 @@
+# Konstanta bersama dashboard dan convert_to_parquet.py (tanpa import streamlit)
+
+# Nama dasar file sumber; versi .parquet dibuat sekali lewat convert_to_parquet.py
+DATA_FILES = (
+    "xerpihan_combined_data",
+    "xerpihan_combined_data_with_growth",
+    "xerpihan_comprehensive_metrics",
+    "xerpihan_final_summary",
+    "xerpihan_financial_metrics",
+    "xerpihan_forecast_combined",
+)
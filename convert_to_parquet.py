@@ -0,0 +1,37 @@
+"""Konversi sekali jalan file CSV sumber dashboard ke Parquet (kompresi snappy).
+
+Jalankan dari direktori yang berisi file CSV:
+
+    python convert_to_parquet.py
+
+data.read_table akan otomatis memakai file .parquet jika tersedia.
+"""
+import pandas as pd
+
+# Daftar file sumber yang sama dengan yang dibaca data.py
+from constants import DATA_FILES
+
+# Kolom label yang tetap berupa teks
+LABEL_COLUMNS = {"Category", "Account", "Scenario"}
+
+
+def convert(name):
+    df = pd.read_csv(f"{name}.csv")
+    # Simpan kolom numerik sudah bertipe supaya dashboard tidak perlu pd.to_numeric lagi.
+    # Kolom hanya dikonversi jika semua nilai non-null bisa di-parse, agar teks tidak hilang jadi NaN
+    for col in df.columns:
+        if col in LABEL_COLUMNS or pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        converted = pd.to_numeric(df[col], errors="coerce")
+        if converted.notna().sum() == df[col].notna().sum():
+            df[col] = converted
+    df.to_parquet(f"{name}.parquet", engine="pyarrow", compression="snappy", index=False)
+
+
+if __name__ == "__main__":
+    for name in DATA_FILES:
+        try:
+            convert(name)
+            print(f"{name}.csv -> {name}.parquet")
+        except FileNotFoundError:
+            print(f"Lewati {name}.csv: file tidak ditemukan")
@@ -0,0 +1,144 @@
+# Data bersama untuk semua halaman dashboard (dimuat dan di-cache sekali per proses)
+import os
+from typing import NamedTuple
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+from constants import DATA_FILES
+
+# Mode render Plotly untuk grafik garis/scatter; ganti ke 'svg' jika browser tidak mendukung WebGL
+PLOTLY_RENDER_MODE = "webgl"
+
+# Kolom tahun pada data pendapatan dan peramalan
+YEARS = tuple(str(y) for y in range(2024, 2032))
+
+# Skema eksplisit untuk fallback CSV: label sebagai dictionary, kolom tahun sebagai float64.
+# Kolom yang tidak tercantum (atau tidak ada di file) tetap diinferensi oleh pyarrow
+CSV_COLUMN_TYPES = {
+    'Scenario': pa.dictionary(pa.int32(), pa.string()),
+    'Category': pa.dictionary(pa.int32(), pa.string()),
+    **{year: pa.float64() for year in YEARS},
+}
+
+def read_table(name):
+    # Parquet sudah bertipe (Arrow), jadi tidak perlu parsing teks dan inferensi dtype
+    parquet_path = f"{name}.parquet"
+    if os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path, engine="pyarrow", dtype_backend="pyarrow")
+    # Fallback jika file belum dikonversi ke Parquet: reader CSV pyarrow (multithread, C++)
+    # dibuka lewat open() agar FileNotFoundError tetap membawa nama file
+    with open(f"{name}.csv", "rb") as f:
+        # strings_can_be_null agar label kosong/"nan" (mis. Account) tetap null seperti pd.read_csv
+        convert_options = pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES, strings_can_be_null=True)
+        table = pacsv.read_csv(f, convert_options=convert_options)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+# Data statis halaman Risk Analysis dan Portfolio Optimization.
+# Modul ini diimport sekali per proses, jadi DataFrame di bawah hanya dibangun sekali
+RISK_COMPONENTS = pd.DataFrame({
+    'Scenario': ['Optimistic', 'Moderate', 'Pessimistic'], 
+    'Market_Risk': [0.15, 0.12, 0.10], 
+    'Credit_Risk': [0.08, 0.07, 0.06], 
+    'Operational_Risk': [0.05, 0.04, 0.03]
+})
+RISK_COMPONENTS_MELTED = RISK_COMPONENTS.melt(id_vars=['Scenario'], var_name='Risk_Type', value_name='Risk_Level')
+
+PORTFOLIO_DATA = pd.DataFrame({
+    'Method': ['HJB', 'Markowitz', 'Black-Litterman', 'RL'], 
+    'Optimistic': [1.000, 0.333, 0.407, 0.055], 
+    'Moderate': [0.000, 0.333, 0.407, 0.775], 
+    'Pessimistic': [0.000, 0.333, 0.296, 0.170]
+})
+PORTFOLIO_DATA_MELTED = PORTFOLIO_DATA.melt(id_vars=['Method'], var_name='Scenario', value_name='Weight')
+
+PERFORMANCE_DATA = pd.DataFrame({
+    'Method': ['HJB', 'Markowitz', 'Black-Litterman', 'RL'], 
+    'Expected_Return': [0.1854, 0.1400, 0.0786, 0.1348], 
+    'Sharpe_Ratio': [1.017e15, 1.985e15, 3.679e14, 1.746e15]
+})
+
+def to_float_array(col):
+    # Kolom dari Parquet sudah numerik, jadi cukup cast di level C tanpa pd.to_numeric
+    if pd.api.types.is_numeric_dtype(col):
+        return col.to_numpy(dtype='float64', na_value=np.nan)
+    # Kolom yang masih berisi teks (CSV, atau Parquet yang kolomnya tidak bisa dikonversi penuh)
+    return pd.to_numeric(col, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+
+# Hasil load_data; halaman cukup membaca field yang dibutuhkan, mis. data.growth_cols
+class DashboardData(NamedTuple):
+    combined_data: pd.DataFrame
+    growth_data: pd.DataFrame
+    metrics: pd.DataFrame
+    final_summary: pd.DataFrame
+    financial_metrics: pd.DataFrame
+    forecast_combined: pd.DataFrame
+    combined_by_cat: dict
+    forecast_by_cat: dict
+    kpis: dict
+    growth_cols: tuple
+
+def nan_mean(values):
+    # Seperti Series.mean: NaN dilewati, dan kolom yang seluruhnya NaN menghasilkan NaN tanpa RuntimeWarning
+    if np.isnan(values).all():
+        return np.nan
+    return np.nanmean(values)
+
+# Load data with improved error handling
+# cache_resource mengembalikan DataFrame yang sama (tanpa pickle) di setiap rerun;
+# halaman hanya membaca data ini, jadi jangan ubah in-place (pakai .copy() bila perlu)
+@st.cache_resource(ttl=None, show_spinner=False)
+def load_data():
+    try:
+        combined_data, growth_data, metrics, final_summary, financial_metrics, forecast_combined = (
+            read_table(name) for name in DATA_FILES
+        )
+        # Kolom label berkardinalitas rendah disimpan sebagai category agar filter/grouping memakai kode integer
+        for df in (combined_data, growth_data, metrics, final_summary, financial_metrics, forecast_combined):
+            for col in ('Scenario', 'Category'):
+                if col in df.columns:
+                    df[col] = df[col].astype('category')
+        # KPI Overview dihitung sekali di sini, bukan di setiap rerun halaman
+        kpi_values = {
+            'revenue_cagr': to_float_array(metrics['Revenue_CAGR']),
+            'ebitda': to_float_array(metrics['Avg_EBITDA_Margin']),
+            'cost': to_float_array(metrics['Cost_to_Revenue']),
+        }
+        kpis = {key: nan_mean(values) for key, values in kpi_values.items()}
+        kpis['has_invalid'] = any(np.isnan(values).any() for values in kpi_values.values())
+        # Kolom pertumbuhan tidak berubah selama sesi, jadi dicari sekali saat data dibaca
+        growth_cols = tuple(c for c in growth_data.columns if 'Growth' in c)
+        # Pisahkan per Category sekali saja agar halaman tidak memfilter ulang di setiap rerun
+        combined_by_cat = {k: g for k, g in combined_data.groupby('Category', sort=False, observed=True)}
+        forecast_by_cat = {k: g for k, g in forecast_combined.groupby('Category', sort=False, observed=True)}
+        return DashboardData(
+            combined_data=combined_data,
+            growth_data=growth_data,
+            metrics=metrics,
+            final_summary=final_summary,
+            financial_metrics=financial_metrics,
+            forecast_combined=forecast_combined,
+            combined_by_cat=combined_by_cat,
+            forecast_by_cat=forecast_by_cat,
+            kpis=kpis,
+            growth_cols=growth_cols,
+        )
+    except FileNotFoundError as e:
+        st.error(f"Error: File '{e.filename}' tidak ditemukan. Pastikan semua file data (Parquet/CSV) ada di direktori yang benar.")
+        return None
+    except Exception as e:
+        st.error(f"Error saat memuat data: {str(e)}. Periksa format file data dan pastikan kolom yang diharapkan ada.")
+        return None
+
+# Serialisasi CSV untuk tombol unduh di-cache agar tidak diulang di setiap rerun
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df):
+    return df.to_csv(index=False).encode()
+
+# Hasil validasi kolom tahun di-cache per himpunan kolom
+@st.cache_data(show_spinner=False)
+def has_year_columns(cols_tuple):
+    return set(YEARS).issubset(cols_tuple)
@@ -0,0 +1,49 @@
+# Financial Analysis Page
+import streamlit as st
+import plotly.express as px
+
+from data import PLOTLY_RENDER_MODE, load_data
+
+# Visualisasi kustom dijalankan sebagai fragment: mengganti sumbu hanya merender ulang bagian ini
+@st.fragment
+def _custom_scatter_fragment(financial_metrics):
+    try:
+        numeric_cols = financial_metrics.select_dtypes(include="number").columns
+        if numeric_cols.empty:
+            st.error("Error: Tidak ada kolom numerik yang ditemukan di financial_metrics.")
+        else:
+            col1, col2 = st.columns(2)
+            with col1:
+                x_axis = st.selectbox("Pilih metrik sumbu X", numeric_cols)
+            with col2:
+                y_axis = st.selectbox("Pilih metrik sumbu Y", numeric_cols)
+            # Regresi OLS (dan import statsmodels oleh Plotly) hanya dijalankan jika diminta
+            show_trend = st.checkbox("Tampilkan garis tren (OLS)", value=False)
+            custom_fig = px.scatter(financial_metrics, x=x_axis, y=y_axis, color='Scenario', 
+                                  title=f'{y_axis} vs {x_axis} per Skenario', trendline="ols" if show_trend else None,
+                                  render_mode=PLOTLY_RENDER_MODE)
+            st.plotly_chart(custom_fig, use_container_width=True)
+    except Exception as e:
+        st.error(f"Error saat membuat visualisasi kustom: {str(e)}")
+
+data = load_data()
+
+st.title("Analisis Kinerja Keuangan")
+
+st.subheader("Metrik Keuangan Utama per Skenario")
+try:
+    metrics_fig = px.bar(data.financial_metrics, x='Scenario', y=['Revenue_CAGR', 'Avg_EBITDA_Margin', 'Avg_Net_Margin'], barmode='group', title='Perbandingan Metrik Keuangan')
+    st.plotly_chart(metrics_fig, use_container_width=True)
+except Exception as e:
+    st.error(f"Error saat membuat visualisasi metrik keuangan: {str(e)}")
+
+st.subheader("Analisis Pertumbuhan")
+try:
+    growth_fig = px.line(data.final_summary, x='Scenario', y=['Revenue_CAGR', 'EBITDA_CAGR'], title='Metrik Pertumbuhan per Skenario', render_mode=PLOTLY_RENDER_MODE)
+    st.plotly_chart(growth_fig, use_container_width=True)
+except Exception as e:
+    st.error(f"Error saat membuat visualisasi analisis pertumbuhan: {str(e)}")
+
+# Custom Visualization
+st.subheader("Visualisasi Kustom")
+_custom_scatter_fragment(data.financial_metrics)
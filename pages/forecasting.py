@@ -0,0 +1,44 @@
+# Forecasting Page
+import streamlit as st
+import numpy as np
+import plotly.express as px
+# Halaman ini memakai go.Box secara langsung
+import plotly.graph_objects as go
+
+from data import PLOTLY_RENDER_MODE, YEARS, has_year_columns, load_data, to_float_array
+
+data = load_data()
+growth_data, growth_cols = data.growth_data, data.growth_cols
+
+st.title("Peramalan Keuangan")
+
+st.subheader("Peramalan Pendapatan per Skenario")
+try:
+    forecast_data = data.forecast_by_cat.get('Pendapatan')
+    if forecast_data is None or forecast_data.empty:
+        st.error("Error: Tidak ada data peramalan pendapatan yang ditemukan.")
+    else:
+        if not has_year_columns(tuple(forecast_data.columns)):
+            st.error("Error: Beberapa kolom tahun tidak ada di data peramalan.")
+        else:
+            forecast_fig = px.line(forecast_data, x='Scenario', y=list(YEARS), title='Peramalan Pendapatan (2024-2031)', render_mode=PLOTLY_RENDER_MODE)
+            st.plotly_chart(forecast_fig, use_container_width=True)
+except Exception as e:
+    st.error(f"Error saat membuat visualisasi peramalan pendapatan: {str(e)}")
+
+st.subheader("Analisis Tingkat Pertumbuhan")
+try:
+    if not growth_cols:
+        st.error("Error: Tidak ada kolom pertumbuhan yang ditemukan di growth_data.")
+    else:
+        # Satu box per skenario dengan semua kolom pertumbuhan digabung (seperti melt), dibangun langsung
+        # dari array lebar: ravel() baris demi baris cocok dengan np.repeat skenario per baris.
+        # Tiap kolom dikonversi seperti kolom KPI, jadi sel teks yang tersisa menjadi NaN
+        growth_values = np.column_stack([to_float_array(growth_data[col]) for col in growth_cols])
+        growth_fig = go.Figure(go.Box(x=np.repeat(growth_data['Scenario'].to_numpy(), len(growth_cols)),
+                                      y=growth_values.ravel()))
+        growth_fig.update_layout(title='Distribusi Tingkat Pertumbuhan per Skenario',
+                                 xaxis_title='Scenario', yaxis_title='value')
+        st.plotly_chart(growth_fig, use_container_width=True)
+except Exception as e:
+    st.error(f"Error saat membuat visualisasi analisis pertumbuhan: {str(e)}")
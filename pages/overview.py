@@ -0,0 +1,59 @@
+# Overview Page
+import streamlit as st
+import plotly.express as px
+
+from data import PLOTLY_RENDER_MODE, YEARS, has_year_columns, load_data, to_csv_bytes
+
+data = load_data()
+
+st.title("Xerpihan Financial Analysis Dashboard")
+st.header("Indikator Kinerja Utama")
+
+try:
+    if data.kpis['has_invalid']:
+        st.warning("Beberapa data numerik tidak valid dan diubah menjadi NaN. Periksa data Anda.")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(label="Rata-rata Revenue CAGR", value=f"{data.kpis['revenue_cagr']:.2f}%")
+    with col2:
+        st.metric(label="Rata-rata EBITDA Margin", value=f"{data.kpis['ebitda']:.2f}%")
+    with col3:
+        st.metric(label="Rata-rata Efisiensi Biaya", value=f"{data.kpis['cost']:.2f}%")
+except Exception as e:
+    st.error(f"Error saat menampilkan indikator kinerja: {str(e)}")
+
+# Revenue Trends
+st.subheader("Tren Pendapatan per Skenario")
+try:
+    revenue_data = data.combined_by_cat.get('Pendapatan')
+    if revenue_data is None or revenue_data.empty:
+        st.error("Error: Tidak ada data pendapatan yang ditemukan.")
+    else:
+        if not has_year_columns(tuple(revenue_data.columns)):
+            st.error("Error: Beberapa kolom tahun tidak ada di data pendapatan.")
+        else:
+            fig = px.line(revenue_data, x='Scenario', y=list(YEARS), title='Tren Pendapatan (2024-2031)', render_mode=PLOTLY_RENDER_MODE)
+            st.plotly_chart(fig, use_container_width=True)
+except Exception as e:
+    st.error(f"Error saat membuat visualisasi tren pendapatan: {str(e)}")
+
+# Data Download
+st.subheader("Unduh Data")
+col1, col2 = st.columns(2)
+with col1:
+    st.download_button(label="Unduh Financial Metrics", data=to_csv_bytes(data.financial_metrics), file_name="financial_metrics.csv", mime="text/csv")
+with col2:
+    st.download_button(label="Unduh Summary Data", data=to_csv_bytes(data.final_summary), file_name="final_summary.csv", mime="text/csv")
+
+# Data Exploration
+st.subheader("Eksplorasi Data")
+dataset_name = st.selectbox("Pilih dataset untuk dieksplorasi", ["Combined Data", "Growth Data", "Metrics", "Final Summary", "Financial Metrics"])
+datasets = {"Combined Data": data.combined_data, "Growth Data": data.growth_data, "Metrics": data.metrics, "Final Summary": data.final_summary, "Financial Metrics": data.financial_metrics}
+explore_df = datasets[dataset_name]
+# Hanya N baris pertama yang diserialisasi dan dikirim ke browser, bukan seluruh frame
+max_rows = min(len(explore_df), 5000)
+if max_rows > 10:
+    n_rows = st.slider("Jumlah baris", 10, max_rows, min(50, max_rows))
+    explore_df = explore_df.head(n_rows)
+st.dataframe(explore_df)
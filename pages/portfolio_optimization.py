@@ -0,0 +1,29 @@
+# Portfolio Optimization Page
+import streamlit as st
+import plotly.express as px
+
+from data import PERFORMANCE_DATA, PLOTLY_RENDER_MODE, PORTFOLIO_DATA_MELTED
+
+# Grafik dari data statis hasilnya selalu sama; cache_resource menghindari pickle Figure di setiap hit
+@st.cache_resource(show_spinner=False)
+def _portfolio_allocation_fig():
+    return px.bar(PORTFOLIO_DATA_MELTED, 
+                  x='Method', y='Weight', color='Scenario', title='Alokasi Portofolio per Metode')
+
+@st.cache_resource(show_spinner=False)
+def _portfolio_performance_fig():
+    return px.scatter(PERFORMANCE_DATA, x='Expected_Return', y='Sharpe_Ratio', color='Method', size=[20]*4, title='Analisis Risiko-Hasil', render_mode=PLOTLY_RENDER_MODE)
+
+st.title("Optimasi Portofolio")
+
+st.subheader("Alokasi Portofolio per Metode")
+try:
+    st.plotly_chart(_portfolio_allocation_fig(), use_container_width=True)
+except Exception as e:
+    st.error(f"Error saat membuat visualisasi alokasi portofolio: {str(e)}")
+
+st.subheader("Metrik Kinerja per Metode")
+try:
+    st.plotly_chart(_portfolio_performance_fig(), use_container_width=True)
+except Exception as e:
+    st.error(f"Error saat membuat visualisasi metrik kinerja: {str(e)}")
@@ -0,0 +1,36 @@
+# Risk Analysis Page
+import streamlit as st
+import plotly.express as px
+
+from data import RISK_COMPONENTS_MELTED, load_data
+
+# Grafik dari data statis hasilnya selalu sama; cache_resource menghindari pickle Figure di setiap hit
+@st.cache_resource(show_spinner=False)
+def _risk_decomposition_fig():
+    return px.bar(RISK_COMPONENTS_MELTED, 
+                  x='Scenario', y='Risk_Level', color='Risk_Type', title='Dekomposisi Risiko per Skenario')
+
+metrics = load_data().metrics
+
+st.title("Analisis Risiko")
+
+st.subheader("Metrik Risiko per Skenario")
+try:
+    # Plot langsung dari metrics; px.bar cukup memakai subset kolom, tanpa DataFrame baru
+    risk_cols = ['Scenario', 'Revenue_Volatility', 'Margin_Volatility']
+    if not set(risk_cols).issubset(metrics.columns):
+        missing = ", ".join(repr(col) for col in risk_cols if col not in metrics.columns)
+        st.error(f"Error: Kolom {missing} tidak ditemukan di data metrics.")
+    else:
+        risk_fig = px.bar(metrics, x='Scenario', y=['Revenue_Volatility', 'Margin_Volatility'], 
+                         barmode='group', title='Metrik Volatilitas per Skenario')
+        st.plotly_chart(risk_fig, use_container_width=True)
+except Exception as e:
+    st.error(f"Error saat membuat visualisasi risiko: {str(e)}")
+
+# Risk Decomposition
+st.subheader("Analisis Dekomposisi Risiko")
+try:
+    st.plotly_chart(_risk_decomposition_fig(), use_container_width=True)
+except Exception as e:
+    st.error(f"Error saat membuat visualisasi dekomposisi risiko: {str(e)}")